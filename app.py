@@ -6,23 +6,158 @@ and provides filtering capabilities based on various criteria.
 """
 
 import argparse
+import atexit
+import bisect
+import heapq
 import json
 import logging
 import re
 import sys
-from typing import Dict, List, Any
-import requests
-
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 # Configuration
 URL = "https://www.helmet.beam.vt.edu/js/bicycleData.js"
 TIMEOUT = 30
 MAX_THRESHOLD_FIELDS = {"cost", "score"}
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Streaming extraction of the bicycleDataRaw array literal
+_DATA_MARKER = b"const bicycleDataRaw"
+_CHUNK_SIZE = 65536
+
+# On-disk cache for the parsed dataset, validated with a conditional GET
+CACHE_DIR = Path.home() / ".cache" / "bikehelmet"
+_CACHE_FILE = CACHE_DIR / "bicycleData.json"
+_ETAG_FILE = CACHE_DIR / "etag"
+
+# The HTTP transport and the optional accelerators (JSON5, orjson, NumPy,
+# numba) are imported on first use by the loaders below, so fast CLI
+# paths like --help never pay their startup cost
+requests: Any = None
+httpx: Any = None
+_session: Any = None
+_client: Any = None
+_FETCH_ERRORS: tuple = ()
+_http_loaded = False
+
+_json5: Any = None
+# json5 (and the stdlib json fallback) report parse errors as ValueError
+_Json5Error: type = ValueError
+orjson: Any = None
+np: Any = None
+prange: Any = None
+_mask_kernel: Any = None
+_accel_loaded = False
+
+
+def _load_http() -> None:
+    """
+    Import the HTTP stack and build the shared transport on first use.
+
+    Prefers one module-wide httpx client (HTTP/2 when the h2 extra is
+    present, closed at exit) so refreshes reuse the TLS connection, with
+    a requests Session as the fallback transport.
+    """
+    global requests, httpx, _session, _client, _FETCH_ERRORS, _http_loaded
+    if _http_loaded:
+        return
+    _http_loaded = True
+
+    import requests as requests_mod
+
+    requests = requests_mod
+    _session = requests_mod.Session()
+    _FETCH_ERRORS = (requests_mod.RequestException,)
+
+    try:
+        import httpx as httpx_mod
+    except ImportError:
+        return
+    httpx = httpx_mod
+    # follow_redirects matches the requests behavior this replaces
+    try:
+        _client = httpx_mod.Client(http2=True, timeout=TIMEOUT, follow_redirects=True)
+    except ImportError:
+        # The h2 extra is not installed; HTTP/1.1 still reuses connections
+        _client = httpx_mod.Client(timeout=TIMEOUT, follow_redirects=True)
+    atexit.register(_client.close)
+    _FETCH_ERRORS = (requests_mod.RequestException, httpx_mod.HTTPError)
+
+
+def _load_accelerators() -> None:
+    """
+    Import the optional parsing and filtering accelerators on first use.
+
+    Every accelerator is best-effort: pyjson5/json5 for direct JS array
+    parsing, orjson for the cache codec, and NumPy (plus a numba-compiled
+    kernel) for columnar index queries. Missing packages simply leave the
+    corresponding fallback in place.
+    """
+    global _json5, _Json5Error, orjson, np, prange, _mask_kernel
+    global _accel_loaded
+    if _accel_loaded:
+        return
+    _accel_loaded = True
+
+    try:
+        import pyjson5
+
+        _json5 = pyjson5
+        _Json5Error = pyjson5.Json5Exception
+    except ImportError:
+        try:
+            import json5
+
+            _json5 = json5
+        except ImportError:
+            pass
+
+    try:
+        import orjson as orjson_mod
+
+        orjson = orjson_mod
+    except ImportError:
+        pass
+
+    try:
+        import numpy as np_mod
+
+        np = np_mod
+    except ImportError:
+        return
+
+    try:
+        from numba import njit
+        from numba import prange as prange_fn
+
+        prange = prange_fn
+        _mask_kernel = njit(parallel=True, cache=True)(_mask_kernel_py)
+    except ImportError:
+        pass
+
+
+# C-implemented sort key over the pre-parsed score from _normalize
+_SCORE_KEY = itemgetter("_score_f")
+
+# Below this many records, threading the normalization pass costs more
+# than the parsing it spreads out
+_PARALLEL_NORMALIZE_MIN = 10_000
+
+# Categorical fields with few distinct values across many records; their
+# lowered copies are interned so equality compares on pointer identity
+_INTERN_FIELDS = ("brand", "style", "certifications", "date")
+
+# Matches either an unquoted object key or a single-quoted string value;
+# handling both in source order keeps keys inside string values untouched
+_JS_TOKEN_RE = re.compile(r"(\w+)(?=\s*:)|'([^']*)'")
+
+# Bytes that affect bracket/quote state while scanning the array literal;
+# a plain character class, so matching is a single linear C scan
+_STRUCTURAL_RE = re.compile(rb"[\[\]'\"\\]")
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +167,151 @@ class BicycleDataError(Exception):
     pass
 
 
+def _read_cached_etag() -> Optional[str]:
+    """Return the ETag of the cached dataset, or None if there is no cache."""
+    try:
+        if _CACHE_FILE.exists():
+            return _ETAG_FILE.read_text().strip() or None
+    except OSError:
+        pass
+    return None
+
+
+def _write_cache(data: List[Dict[str, Any]], etag: Optional[str]) -> None:
+    """Persist the parsed dataset and its ETag for future conditional GETs."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            _CACHE_FILE.write_bytes(orjson.dumps(data))
+        else:
+            _CACHE_FILE.write_text(json.dumps(data))
+        if etag:
+            _ETAG_FILE.write_text(etag)
+        elif _ETAG_FILE.exists():
+            _ETAG_FILE.unlink()
+    except OSError as e:
+        logger.debug(f"Could not write cache: {e}")
+
+
+def _find_array_start(pending: bytes) -> Tuple[bytes, bool]:
+    """
+    Look for the data marker and its opening bracket in buffered bytes.
+
+    Returns the bytes still worth keeping (trimmed to a marker-sized tail
+    while searching) and whether the opening bracket was found; when it
+    was, the returned bytes start at that bracket.
+    """
+    marker_at = pending.find(_DATA_MARKER)
+    if marker_at < 0:
+        # Keep a tail in case the marker straddles a chunk boundary
+        return pending[-(len(_DATA_MARKER) - 1) :], False
+    start = pending.find(b"[", marker_at)
+    if start < 0:
+        return pending[marker_at:], False
+    return pending[start:], True
+
+
+def _scan_brackets(
+    pending: bytes, pos: int, depth: int, quote: int
+) -> Tuple[int, int, int, bool]:
+    """
+    Advance the bracket/quote state machine across one buffered chunk.
+
+    Jumps between state-changing bytes with a C-level scan instead of
+    stepping through every byte in Python. Returns (end, depth, quote,
+    escaped), where end is the exclusive offset of the array's closing
+    bracket or -1 if this chunk ended before reaching it.
+    """
+    escaped = False
+    while (match := _STRUCTURAL_RE.search(pending, pos)) is not None:
+        offset = match.start()
+        byte = pending[offset]
+        pos = offset + 1
+        if quote:
+            if byte == 0x5C:  # backslash: skip the escaped byte
+                if pos < len(pending):
+                    pos += 1
+                else:
+                    escaped = True
+            elif byte == quote:
+                quote = 0
+        elif byte in (0x22, 0x27):  # double or single quote
+            quote = byte
+        elif byte == 0x5B:  # [
+            depth += 1
+        elif byte == 0x5D:  # ]
+            depth -= 1
+            if depth == 0:
+                return pos, depth, quote, escaped
+    return -1, depth, quote, escaped
+
+
+def _extract_array_text(chunks: Iterable[bytes]) -> str:
+    """
+    Incrementally extract the bicycleDataRaw array from streamed chunks.
+
+    Scans chunks for the assignment marker, then tracks bracket depth
+    (respecting quote state) until the matching closing bracket, so only
+    the array literal itself is buffered and decoded rather than the
+    whole JS file.
+
+    Args:
+        chunks: Iterable of byte chunks from a streaming response
+
+    Returns:
+        The array literal, including surrounding brackets, as text
+
+    Raises:
+        BicycleDataError: If the array cannot be located in the response
+    """
+    pending = b""
+    parts: List[bytes] = []
+    in_array = False
+    depth = 0
+    quote = 0  # active quote character, or 0 when outside strings
+    escaped = False
+
+    for chunk in chunks:
+        pending += chunk
+        if not in_array:
+            pending, in_array = _find_array_start(pending)
+            if not in_array:
+                continue
+
+        pos = 1 if escaped and pending else 0
+        end, depth, quote, escaped = _scan_brackets(pending, pos, depth, quote)
+        if end >= 0:
+            parts.append(pending[:end])
+            return b"".join(parts).decode("utf-8")
+
+        parts.append(pending)
+        pending = b""
+
+    raise BicycleDataError("Could not find bicycleDataRaw in JS response")
+
+
+def _read_cached_data() -> List[Dict[str, Any]]:
+    """Load the cached dataset written by a previous successful fetch."""
+    cached = _CACHE_FILE.read_bytes()
+    if orjson is not None:
+        return orjson.loads(cached)
+    return json.loads(cached)
+
+
+def _parse_array_text(array_text: str) -> List[Dict[str, Any]]:
+    """Parse the extracted JS array literal into a list of records."""
+    if _json5 is not None:
+        # JSON5 tolerates unquoted keys and single-quoted strings, so
+        # the array literal parses as-is with no intermediate string
+        return _json5.loads(array_text)
+    # Convert JS-like syntax to JSON in a single pass: quote unquoted
+    # object keys and rewrite single-quoted strings as double-quoted
+    json_text = _JS_TOKEN_RE.sub(lambda m: f'"{m.group(1) or m.group(2)}"', array_text)
+    if orjson is not None:
+        return orjson.loads(json_text)
+    return json.loads(json_text)
+
+
 def fetch_bicycle_data(url: str = URL) -> List[Dict[str, Any]]:
     """
     Fetch bicycle helmet data from the specified URL.
@@ -45,44 +325,348 @@ def fetch_bicycle_data(url: str = URL) -> List[Dict[str, Any]]:
     Raises:
         BicycleDataError: If data fetching or parsing fails
     """
+    _load_http()
+    _load_accelerators()
+
     try:
+        headers = {}
+        etag = _read_cached_etag()
+        if etag:
+            headers["If-None-Match"] = etag
+
         logger.info(f"Fetching data from {url}")
-        response = requests.get(url, timeout=TIMEOUT)
-        response.raise_for_status()
-        js_code = response.text
+        if _client is not None:
+            response_cm = _client.stream("GET", url, headers=headers)
+        else:
+            response_cm = _session.get(
+                url, stream=True, timeout=TIMEOUT, headers=headers
+            )
+        with response_cm as response:
+            if response.status_code == 304:
+                data = _read_cached_data()
+                logger.info(f"Loaded {len(data)} helmet records from cache")
+                return _normalize(data)
+            response.raise_for_status()
+            if _client is not None:
+                chunks = response.iter_bytes(chunk_size=_CHUNK_SIZE)
+            else:
+                chunks = response.iter_content(chunk_size=_CHUNK_SIZE)
+            array_text = _extract_array_text(chunks)
+            new_etag = response.headers.get("ETag")
 
-        # Extract the array assigned to bicycleDataRaw
-        match = re.search(
-            r"const\s+bicycleDataRaw\s*=\s*(\[.*?\]);", js_code, re.DOTALL
+        data = _parse_array_text(array_text)
+        _write_cache(data, new_etag)
+        logger.info(f"Successfully fetched {len(data)} helmet records")
+        return _normalize(data)
+
+    except _FETCH_ERRORS as e:
+        raise BicycleDataError(f"Failed to fetch data: {e}")
+    except (json.JSONDecodeError, _Json5Error) as e:
+        raise BicycleDataError(f"Failed to parse JSON: {e}")
+    except OSError as e:
+        raise BicycleDataError(f"Failed to read cached data: {e}")
+
+
+def _mask_kernel_py(scores, costs, score_max, cost_max, cat_codes, cat_queries):  # type: ignore[no-untyped-def]
+    """Parallel boolean mask over contiguous columns; inf means no limit.
+
+    Only ever called through its numba-compiled form (_mask_kernel),
+    which _load_accelerators builds when numba is installed.
+    """
+    n = scores.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in prange(n):
+        ok = scores[i] <= score_max
+        if ok and cost_max != np.inf:
+            ok = costs[i] <= cost_max
+        if ok:
+            for j in range(cat_queries.shape[0]):
+                if cat_codes[j, i] != cat_queries[j]:
+                    ok = False
+                    break
+        out[i] = ok
+    return out
+
+
+@dataclass
+class Index:
+    """Precomputed lookup structures for repeated filter queries."""
+
+    data: List[Dict[str, Any]]
+    # field -> lowercased value -> indices of records holding that value
+    postings: Dict[str, Dict[str, List[int]]]
+    # pre-parsed scores/costs sorted ascending, with the record index
+    # at each sorted position, for bisect-based threshold lookups
+    scores: List[float]
+    score_order: List[int]
+    costs: List[float]
+    cost_order: List[int]
+    # contiguous NumPy columns (None without numpy): float64 score/cost
+    # in record order, plus int32 codes and vocab per categorical field
+    scores_arr: Any = None
+    costs_arr: Any = None
+    cat_codes: Optional[Dict[str, Any]] = None
+    cat_vocab: Optional[Dict[str, Dict[str, int]]] = None
+
+
+def build_index(data: List[Dict[str, Any]]) -> Index:
+    """
+    Build an Index over the dataset for repeated filter queries.
+
+    Posting lists cover every exact-match field; cost and score get
+    sorted arrays so threshold filters resolve with a binary search.
+    Worth building whenever the same dataset is queried more than once,
+    e.g. behind a service endpoint.
+
+    Args:
+        data: List of dictionaries containing bicycle helmet data
+
+    Returns:
+        An Index answering queries via filter_bicycle_data
+    """
+    _load_accelerators()
+
+    if data and "_score_f" not in data[0]:
+        _normalize(data)
+
+    postings: Dict[str, Dict[str, List[int]]] = {}
+    for i, item in enumerate(data):
+        for field, value in item.items():
+            if field in MAX_THRESHOLD_FIELDS or field.startswith("_"):
+                continue
+            postings.setdefault(field, {}).setdefault(str(value).lower(), []).append(i)
+
+    score_pairs = sorted((item["_score_f"], i) for i, item in enumerate(data))
+    cost_pairs = sorted(
+        (item["_cost_f"], i)
+        for i, item in enumerate(data)
+        if item["_cost_f"] is not None
+    )
+    index = Index(
+        data=data,
+        postings=postings,
+        scores=[score for score, _ in score_pairs],
+        score_order=[i for _, i in score_pairs],
+        costs=[cost for cost, _ in cost_pairs],
+        cost_order=[i for _, i in cost_pairs],
+    )
+
+    if np is not None:
+        index.scores_arr = np.array([item["_score_f"] for item in data], np.float64)
+        index.costs_arr = np.array(
+            [
+                float("nan") if item["_cost_f"] is None else item["_cost_f"]
+                for item in data
+            ],
+            np.float64,
         )
-        if not match:
-            raise BicycleDataError("Could not find bicycleDataRaw in JS response")
+        # Encode categorical fields as int32 codes; -1 marks a missing field
+        index.cat_codes = {}
+        index.cat_vocab = {}
+        for field in postings:
+            vocab: Dict[str, int] = {}
+            codes = np.full(len(data), -1, np.int32)
+            for i, item in enumerate(data):
+                if field in item:
+                    key = str(item[field]).lower()
+                    codes[i] = vocab.setdefault(key, len(vocab))
+            index.cat_codes[field] = codes
+            index.cat_vocab[field] = vocab
+
+    return index
+
+
+def _evaluate_mask(
+    index: Index,
+    score_max: float,
+    cost_max: float,
+    cat_filters: List[Tuple[Any, int]],
+) -> Any:
+    """Build the boolean match mask, via the numba kernel when compiled."""
+    if _mask_kernel is not None:
+        n = len(index.data)
+        if cat_filters:
+            cat_codes = np.stack([codes for codes, _ in cat_filters])
+            cat_queries = np.array([code for _, code in cat_filters], np.int32)
+        else:
+            cat_codes = np.empty((0, n), np.int32)
+            cat_queries = np.empty(0, np.int32)
+        return _mask_kernel(
+            index.scores_arr,
+            index.costs_arr,
+            score_max,
+            cost_max,
+            cat_codes,
+            cat_queries,
+        )
+    mask = index.scores_arr <= score_max
+    if cost_max != float("inf"):
+        mask &= index.costs_arr <= cost_max
+    for codes, code in cat_filters:
+        mask &= codes == code
+    return mask
 
-        array_text = match.group(1)
 
-        # Convert JS-like syntax to JSON
-        json_text = array_text
-        # Replace unquoted object keys with quoted keys
-        json_text = re.sub(r"(\w+)(?=\s*:)", r'"\1"', json_text)
-        # Replace single quotes with double quotes for string values
-        json_text = re.sub(r"'([^']*)'", r'"\1"', json_text)
+def _filter_with_columns(
+    index: Index, filters: Dict[str, Any]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Evaluate a filter query as one boolean mask over the Index's columns.
 
-        data = json.loads(json_text)
-        logger.info(f"Successfully fetched {len(data)} helmet records")
-        return data
+    Thresholds compare against the float64 score/cost arrays and exact
+    matches against the int32 code columns — via the numba kernel when
+    compiled, otherwise plain NumPy ops. Returns None when NumPy columns
+    are unavailable so the caller can fall back to posting lists.
 
-    except requests.RequestException as e:
-        raise BicycleDataError(f"Failed to fetch data: {e}")
-    except json.JSONDecodeError as e:
-        raise BicycleDataError(f"Failed to parse JSON: {e}")
+    Args:
+        index: Index built by build_index
+        filters: Dictionary of field:value pairs to filter by
+
+    Returns:
+        Matching record dicts sorted by score, or None if not applicable
+    """
+    if np is None or index.scores_arr is None:
+        return None
+
+    score_max = cost_max = float("inf")
+    cat_filters = []
+    for field, value in filters.items():
+        if field in MAX_THRESHOLD_FIELDS:
+            try:
+                max_val = float(value)
+            except (ValueError, TypeError):
+                logger.warning(f"Failed to convert {field} filter value: {value}")
+                return []
+            if field == "cost":
+                cost_max = max_val
+            else:
+                score_max = max_val
+        else:
+            code = index.cat_vocab.get(field, {}).get(str(value).lower())
+            if code is None:
+                return []
+            cat_filters.append((index.cat_codes[field], code))
+
+    mask = _evaluate_mask(index, score_max, cost_max, cat_filters)
+    matched = np.nonzero(mask)[0]
+    # Keep the sort in NumPy, not inside the numba kernel; the stable kind
+    # preserves the tie order of the Python sort it replaces
+    order = np.argsort(index.scores_arr[matched], kind="stable")
+    return [index.data[i] for i in matched[order]]
 
 
-def filter_bicycle_data(data: List[Dict[str, Any]], **filters) -> List[Dict[str, Any]]:
+def _filter_with_index(index: Index, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Filter bicycle data based on provided criteria and sort by score (low to high).
+    Answer a filter query from a prebuilt Index.
+
+    Intersects the smallest candidate lists first and resolves cost and
+    score thresholds with bisect, so per-query work scales with the
+    result size plus log N instead of the full dataset.
+
+    Args:
+        index: Index built by build_index
+        filters: Dictionary of field:value pairs to filter by
+
+    Returns:
+        List of matching record dicts sorted by score (ascending)
+    """
+    columnar = _filter_with_columns(index, filters)
+    if columnar is not None:
+        return columnar
+
+    candidate_lists: List[List[int]] = []
+
+    for field, value in filters.items():
+        if field in MAX_THRESHOLD_FIELDS:
+            try:
+                max_val = float(value)
+            except (ValueError, TypeError):
+                logger.warning(f"Failed to convert {field} filter value: {value}")
+                return []
+            if field == "cost":
+                pos = bisect.bisect_right(index.costs, max_val)
+                candidate_lists.append(index.cost_order[:pos])
+            else:
+                pos = bisect.bisect_right(index.scores, max_val)
+                candidate_lists.append(index.score_order[:pos])
+        else:
+            posting = index.postings.get(field, {}).get(str(value).lower())
+            if not posting:
+                return []
+            candidate_lists.append(posting)
+
+    if candidate_lists:
+        candidate_lists.sort(key=len)
+        matched = set(candidate_lists[0])
+        for candidates in candidate_lists[1:]:
+            matched &= set(candidates)
+            if not matched:
+                return []
+        # Record order before the score sort keeps tie ordering identical
+        # to the scan and columnar paths
+        results = [index.data[i] for i in sorted(matched)]
+    else:
+        results = list(index.data)
+
+    results.sort(key=_SCORE_KEY)
+    return results
+
+
+def _normalize(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Pre-parse numeric fields so filtering and sorting never reparse them.
+
+    Adds "_cost_f" and "_score_f" keys holding float versions of cost
+    (dollar sign stripped) and score. Unparsable or missing values become
+    None for cost and inf for score, so such records fail cost thresholds
+    and sort last.
+
+    On large datasets the per-record work is spread over a thread pool;
+    small lists are normalized inline to avoid the pool overhead.
 
     Args:
         data: List of dictionaries containing bicycle helmet data
+
+    Returns:
+        The same list, with the derived keys added to each record
+    """
+    if len(data) >= _PARALLEL_NORMALIZE_MIN:
+        with ThreadPoolExecutor() as executor:
+            # Consume the iterator to surface any worker exception
+            list(executor.map(_normalize_item, data, chunksize=64))
+    else:
+        for item in data:
+            _normalize_item(item)
+    return data
+
+
+def _normalize_item(item: Dict[str, Any]) -> None:
+    """Add the pre-parsed and interned derived keys to a single record."""
+    try:
+        item["_cost_f"] = float(str(item["cost"]).replace("$", ""))
+    except (KeyError, ValueError, TypeError):
+        item["_cost_f"] = None
+    try:
+        item["_score_f"] = float(item["score"])
+    except (KeyError, ValueError, TypeError):
+        item["_score_f"] = float("inf")
+    # Interned lowered copies of categorical fields; the displayed
+    # originals are left untouched
+    for key in _INTERN_FIELDS:
+        value = item.get(key)
+        if isinstance(value, str):
+            item[f"_{key}_l"] = sys.intern(value.lower())
+
+
+def filter_bicycle_data(
+    data: Union[List[Dict[str, Any]], Index], **filters: Any
+) -> List[Dict[str, Any]]:
+    """
+    Filter bicycle data based on provided criteria and sort by score (low to high).
+
+    Args:
+        data: List of dictionaries containing bicycle helmet data, or an
+              Index built by build_index for repeated queries
         **filters: Keyword arguments for filtering
                   cost and score are treated as maximum values (inclusive)
                   other fields use exact match (case insensitive)
@@ -93,19 +677,34 @@ def filter_bicycle_data(data: List[Dict[str, Any]], **filters) -> List[Dict[str,
     Raises:
         BicycleDataError: If filtering fails
     """
+    _load_accelerators()
+
+    if isinstance(data, Index):
+        filtered_data = _filter_with_index(data, filters)
+        logger.info(
+            f"Filtered {len(data.data)} items down to {len(filtered_data)} items"
+        )
+        return filtered_data
+
     if not data:
         logger.warning("No data provided for filtering")
         return []
 
     try:
-        filtered_data = []
+        # Data straight from fetch_bicycle_data is already normalized;
+        # only pay the pre-parse pass for lists built elsewhere
+        if "_score_f" not in data[0]:
+            _normalize(data)
 
-        for item in data:
-            if _item_matches_filters(item, filters):
-                filtered_data.append(item)
+        # Specialize each filter into a closure once, so the record
+        # loop does no field dispatch or string coercion
+        predicates = _compile_filters(filters)
+        filtered_data = [
+            item for item in data if all(pred(item) for pred in predicates)
+        ]
 
-        # Sort by score (low to high)
-        filtered_data.sort(key=lambda x: float(x.get("score", float("inf"))))
+        # Sort by pre-parsed score (low to high)
+        filtered_data.sort(key=_SCORE_KEY)
 
         logger.info(f"Filtered {len(data)} items down to {len(filtered_data)} items")
         return filtered_data
@@ -114,101 +713,180 @@ def filter_bicycle_data(data: List[Dict[str, Any]], **filters) -> List[Dict[str,
         raise BicycleDataError(f"Failed to filter data: {e}")
 
 
-def _item_matches_filters(item: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+def iter_filtered(
+    data: List[Dict[str, Any]], **filters: Any
+) -> Iterator[Dict[str, Any]]:
     """
-    Check if an item matches all provided filters.
+    Lazily yield records matching the filters, in dataset order.
+
+    Unlike filter_bicycle_data this materializes no list and does not
+    sort; combine with top_k when only the best few records are needed.
 
     Args:
-        item: Dictionary representing a helmet record
-        filters: Dictionary of field:value pairs to filter by
+        data: List of dictionaries containing bicycle helmet data
+        **filters: Keyword arguments for filtering, as in
+                   filter_bicycle_data
+
+    Yields:
+        Matching record dicts
+    """
+    if data and "_score_f" not in data[0]:
+        _normalize(data)
+
+    predicates = _compile_filters(filters)
+    for item in data:
+        if all(pred(item) for pred in predicates):
+            yield item
+
+
+def top_k(data: List[Dict[str, Any]], k: int, **filters: Any) -> List[Dict[str, Any]]:
+    """
+    Return the k safest (lowest-score) records matching the filters.
+
+    heapq.nsmallest keeps only k candidates while consuming the lazy
+    iterator — O(N log k) instead of filtering, materializing and fully
+    sorting the whole result.
+
+    Args:
+        data: List of dictionaries containing bicycle helmet data
+        k: Maximum number of records to return
+        **filters: Keyword arguments for filtering, as in
+                   filter_bicycle_data
 
     Returns:
-        True if item matches all filters, False otherwise
+        Up to k matching record dicts sorted by score (ascending)
     """
-    for field, value in filters.items():
+    return heapq.nsmallest(k, iter_filtered(data, **filters), key=_SCORE_KEY)
+
+
+def _make_threshold_pred(
+    field: str, value: Any
+) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Build a predicate comparing a pre-parsed numeric field to a maximum.
+
+    Returns None when the filter value does not parse as a float, so the
+    caller can reject the whole query as the eager paths do.
+    """
+    try:
+        max_val = float(value)
+    except (ValueError, TypeError):
+        return None
+    key = "_cost_f" if field == "cost" else "_score_f"
+
+    def threshold_pred(item: Dict[str, Any]) -> bool:
+        item_val = item[key]
+        return item_val is not None and item_val <= max_val
+
+    return threshold_pred
+
+
+def _make_exact_pred(field: str, value: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Build a case-insensitive equality predicate for one field."""
+    expected = str(value).lower()
+    derived = None
+    if field in _INTERN_FIELDS:
+        # Both sides interned: equality short-circuits on identity
+        expected = sys.intern(expected)
+        derived = f"_{field}_l"
+
+    def exact_pred(item: Dict[str, Any]) -> bool:
+        if derived is not None:
+            interned = item.get(derived)
+            if interned is not None:
+                return interned == expected
         if field not in item:
             return False
+        item_value = item[field]
+        # Fast path: values already equal without string coercion
+        if item_value == value:
+            return True
+        if isinstance(item_value, str):
+            return item_value.lower() == expected
+        return str(item_value).lower() == expected
 
-        # Special handling for threshold fields
-        if field in MAX_THRESHOLD_FIELDS:
-            if not _check_threshold_filter(item[field], value, field):
-                return False
-        else:
-            # Exact match for other fields (case insensitive)
-            if str(item[field]).lower() != str(value).lower():
-                return False
-
-    return True
+    return exact_pred
 
 
-def _check_threshold_filter(item_value: Any, filter_value: Any, field: str) -> bool:
+def _compile_filters(
+    filters: Dict[str, Any],
+) -> List[Callable[[Dict[str, Any]], bool]]:
     """
-    Check if item value is within threshold for cost/score fields.
+    Specialize each filter into a closure over its prepared value.
+
+    Threshold fields close over the parsed float maximum and read the
+    pre-parsed "_cost_f"/"_score_f" values from _normalize; exact-match
+    fields close over the lowercased filter value. The per-record loop
+    then only calls the closures, with no dispatch on field names and
+    no repeated string coercion.
 
     Args:
-        item_value: Value from the helmet record
-        filter_value: Maximum allowed value
-        field: Field name (cost or score)
+        filters: Dictionary of field:value pairs to filter by
 
     Returns:
-        True if item_value <= filter_value, False otherwise
+        One predicate per filter, each taking a record dict
     """
-    try:
-        if field == "cost":
-            # Remove dollar sign and convert to float
-            item_val = float(str(item_value).replace("$", ""))
-        else:  # score
-            item_val = float(item_value)
+    predicates: List[Callable[[Dict[str, Any]], bool]] = []
 
-        max_val = float(filter_value)
-        return item_val <= max_val
+    for field, value in filters.items():
+        if field in MAX_THRESHOLD_FIELDS:
+            pred = _make_threshold_pred(field, value)
+            if pred is None:
+                logger.warning(f"Failed to convert {field} filter value: {value}")
+                return [lambda item: False]
+            predicates.append(pred)
+        else:
+            predicates.append(_make_exact_pred(field, value))
 
-    except (ValueError, TypeError):
-        logger.warning(
-            f"Failed to convert {field} values: item={item_value}, filter={filter_value}"
-        )
-        return False
+    return predicates
 
 
 def print_results(filtered_data: List[Dict[str, Any]], filters: Dict[str, Any]) -> None:
     """
     Print filtered results in a formatted manner.
 
+    Builds the whole report in memory and emits it with a single write,
+    instead of one syscall per print call.
+
     Args:
         filtered_data: List of filtered helmet records
         filters: Dictionary of applied filters
     """
-    print(f"\nFiltered data ({len(filtered_data)} items):")
-    print("=" * 60)
+    lines = [f"\nFiltered data ({len(filtered_data)} items):", "=" * 60]
 
     if not filtered_data:
-        print("No helmets match your criteria.")
+        lines.append("No helmets match your criteria.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     for i, item in enumerate(filtered_data, 1):
-        print(f"\n{i}. {item.get('brand', 'Unknown')} - {item.get('model', 'Unknown')}")
-        print(
+        lines.append(
+            f"\n{i}. {item.get('brand', 'Unknown')} - {item.get('model', 'Unknown')}"
+        )
+        lines.append(
             f"   Score: {item.get('score', 'N/A')} | Cost: {item.get('cost', 'N/A')} | Style: {item.get('style', 'N/A')}"
         )
-        print(
+        lines.append(
             f"   Rating: {item.get('rating', 'N/A')} stars | Date: {item.get('date', 'N/A')}"
         )
         if item.get("certifications"):
-            print(f"   Certifications: {item.get('certifications')}")
-        print("-" * 60)
+            lines.append(f"   Certifications: {item.get('certifications')}")
+        lines.append("-" * 60)
 
-    # Print filter summary
-    print("\nFILTER SUMMARY:")
+    # Filter summary
+    lines.append("\nFILTER SUMMARY:")
     if not filters:
-        print("No filters applied - showing all data")
+        lines.append("No filters applied - showing all data")
     else:
         for key, value in filters.items():
             if key in MAX_THRESHOLD_FIELDS:
-                print(f"Maximum {key.capitalize()}: {value}")
+                lines.append(f"Maximum {key.capitalize()}: {value}")
             else:
-                print(f"{key.capitalize()}: {value}")
-    print(f"Total results: {len(filtered_data)} items")
-    print("=" * 60)
+                lines.append(f"{key.capitalize()}: {value}")
+    lines.append(f"Total results: {len(filtered_data)} items")
+    lines.append("=" * 60)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -242,6 +920,12 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--certifications", type=str, help="Filter by certifications (e.g., CPSC, MIPS)"
     )
+    parser.add_argument(
+        "--top",
+        type=int,
+        metavar="K",
+        help="Show only the K safest matching helmets (e.g., 5)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
@@ -253,8 +937,11 @@ def main() -> None:
     """Main function to orchestrate data fetching and filtering."""
     args = parse_arguments()
 
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    # Configure logging only once the CLI is actually going to do work
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
 
     try:
         # Fetch data
@@ -264,11 +951,14 @@ def main() -> None:
         filters = {
             k: v
             for k, v in vars(args).items()
-            if v is not None and k not in ["verbose"]
+            if v is not None and k not in ["verbose", "top"]
         }
 
         # Apply filters
-        filtered_data = filter_bicycle_data(bicycle_data, **filters)
+        if args.top is not None:
+            filtered_data = top_k(bicycle_data, args.top, **filters)
+        else:
+            filtered_data = filter_bicycle_data(bicycle_data, **filters)
 
         # Display results
         print_results(filtered_data, filters)